@@ -9,6 +9,7 @@ from typing import Union, Tuple, Optional
 
 import github.GithubException
 import mock
+import pytest
 import requests.exceptions
 from flask import Flask, Response
 
@@ -17,6 +18,8 @@ from publish.github_action import GithubAction
 
 
 @unittest.skipIf(sys.platform != 'linux', 'Pickling the mock REST endpoint only works Linux')
+# all tests bind the mock REST endpoint to the same port, so they have to run in the same pytest-xdist worker
+@pytest.mark.xdist_group('github-api')
 class TestGitHub(unittest.TestCase):
 
     base_url = f'http://localhost:12380/api'
@@ -20,14 +20,128 @@ from publish.unittestresults import get_stats, UnitTestCase, ParseError, get_tes
 from test_utils import temp_locale, d, n
 
 test_files_path = pathlib.Path(__file__).resolve().parent / 'files' / 'junit-xml'
+pytest_files = [str(test_files_path / 'pytest' / file)
+                for file in ['junit.gloo.elastic.spark.tf.xml',
+                             'junit.gloo.elastic.spark.torch.xml',
+                             'junit.gloo.elastic.xml',
+                             'junit.gloo.standalone.xml',
+                             'junit.gloo.static.xml',
+                             'junit.mpi.integration.xml',
+                             'junit.mpi.standalone.xml',
+                             'junit.mpi.static.xml',
+                             'junit.spark.integration.1.xml',
+                             'junit.spark.integration.2.xml']]
 
 
 errors = [ParseError('file', 'error', 1, 2, exception=ValueError("Invalid value"))]
 
+suite_details = [UnitTestSuite('suite', 7, 3, 2, 1, 'std-out', 'std-err')]
+
+# stats used as input by multiple tests
+stats_with_runs = UnitTestRunResults(
+    files=1, errors=[], suites=2, duration=3, suite_details=suite_details,
+    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=0,
+    runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=0,
+    commit='commit'
+)
+stats_with_runs_and_errors = UnitTestRunResults(
+    files=1, errors=[], suites=2, duration=3, suite_details=suite_details,
+    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
+    runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=13,
+    commit='commit'
+)
+stats_without_runs_with_errors = UnitTestRunResults(
+    files=1, errors=[], suites=2, duration=3, suite_details=suite_details,
+    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
+    runs=4, runs_succ=5, runs_skip=6, runs_fail=7, runs_error=8,
+    commit='commit'
+)
+stats_with_deltas = UnitTestRunDeltaResults(
+    files=n(1, 2), errors=[], suites=n(2, -3), duration=d(3, 4),
+    tests=n(4, -5), tests_succ=n(5, 6), tests_skip=n(6, -7), tests_fail=n(7, 8), tests_error=n(8, -9),
+    runs=n(9, 10), runs_succ=n(10, -11), runs_skip=n(11, 12), runs_fail=n(12, -13), runs_error=n(13, 14),
+    commit='123456789abcdef0', reference_type='type', reference_commit='0123456789abcdef'
+)
+
 
 class PublishTest(unittest.TestCase):
-    old_locale = None
-    details = [UnitTestSuite('suite', 7, 3, 2, 1, 'std-out', 'std-err')]
+    details = suite_details
+    stats = None
+
+    # arguments and expected results of get_formatted_digits, built once for all locales
+    formatted_digits_cases = (
+        ((None,), (3, 0)),
+        ((None, 1), (3, 0)),
+        ((None, 123), (3, 0)),
+        ((None, 1234), (5, 0)),
+        ((0,), (1, 0)),
+        ((1, 2, 3), (1, 0)),
+        ((10,), (2, 0)),
+        ((100,), (3, 0)),
+        ((1234, 123, 0), (5, 0)),
+
+        ((dict(),), (3, 3)),
+        ((dict(number=1),), (1, 3)),
+        ((dict(number=12),), (2, 3)),
+        ((dict(number=123),), (3, 3)),
+        ((dict(number=1234),), (5, 3)),
+
+        ((dict(delta=1),), (3, 1)),
+        ((dict(number=1, delta=1),), (1, 1)),
+        ((dict(number=1, delta=12),), (1, 2)),
+        ((dict(number=1, delta=123),), (1, 3)),
+        ((dict(number=1, delta=1234),), (1, 5)),
+    )
+
+    # arguments and expected results of as_delta
+    delta_cases = (
+        ((0, 1), '±0'),
+        ((+1, 1), '+1'),
+        ((-2, 1), ' - 2'),
+
+        ((0, 2), '±  0'),
+        ((+1, 2), '+  1'),
+        ((-2, 2), ' -   2'),
+
+        ((1, 5), '+       1'),
+        ((12, 5), '+     12'),
+        ((123, 5), '+   123'),
+        ((1234, 5), '+1 234'),
+        ((1234, 6), '+  1 234'),
+        ((123, 6), '+     123'),
+    )
+
+    # arguments (without label) and expected results of as_stat_number with label 'unit'
+    stat_number_cases = (
+        ((None, 1, 0), 'N/A unit'),
+
+        ((1, 1, 0), '1 unit'),
+        ((123, 6, 0), '     123 unit'),
+        ((1234, 6, 0), '  1 234 unit'),
+        ((12345, 6, 0), '12 345 unit'),
+
+        ((dict(number=1), 1, 0), '1 unit'),
+
+        ((dict(number=1, delta=-1), 1, 1), '1 unit  - 1 '),
+        ((dict(number=2, delta=+0), 1, 1), '2 unit ±0 '),
+        ((dict(number=3, delta=+1), 1, 1), '3 unit +1 '),
+        ((dict(number=3, delta=+1), 1, 2), '3 unit +  1 '),
+        ((dict(number=3, delta=+1), 2, 2), '  3 unit +  1 '),
+        ((dict(number=3, delta=+1234), 1, 6), '3 unit +  1 234 '),
+        ((dict(number=3, delta=+12345), 1, 6), '3 unit +12 345 '),
+
+        ((dict(delta=-1), 3, 1), 'N/A unit  - 1 '),
+
+        ((dict(number=1, delta=-2, new=3), 1, 1), '1 unit  - 2, 3 new '),
+        ((dict(number=2, delta=+0, new=3, gone=4), 1, 1), '2 unit ±0, 3 new, 4 gone '),
+        ((dict(number=3, delta=+1, gone=4), 1, 1), '3 unit +1, 4 gone '),
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # parse the pytest files and derive their stats only once for all tests in this class
+        parsed = process_junit_xml_elems(parse_junit_xml_files(pytest_files, False, False)).with_commit('example')
+        cls.stats = get_stats(get_test_results(parsed, False))
 
     def test_test_changes(self):
         changes = SomeTestChanges(['removed-test', 'removed-skip', 'remain-test', 'remain-skip', 'skip', 'unskip'],
@@ -330,39 +444,11 @@ class PublishTest(unittest.TestCase):
         self.assertEqual('file name ‑ class name ‑ test name', get_test_name('file name', 'class name', 'test name'))
 
     def test_get_formatted_digits(self):
-        self.assertEqual(get_formatted_digits(None), (3, 0))
-        self.assertEqual(get_formatted_digits(None, 1), (3, 0))
-        self.assertEqual(get_formatted_digits(None, 123), (3, 0))
-        self.assertEqual(get_formatted_digits(None, 1234), (5, 0))
-        self.assertEqual(get_formatted_digits(0), (1, 0))
-        self.assertEqual(get_formatted_digits(1, 2, 3), (1, 0))
-        self.assertEqual(get_formatted_digits(10), (2, 0))
-        self.assertEqual(get_formatted_digits(100), (3, 0))
-        self.assertEqual(get_formatted_digits(1234, 123, 0), (5, 0))
-        with temp_locale('en_US'):
-            self.assertEqual(get_formatted_digits(1234, 123, 0), (5, 0))
-        with temp_locale('de_DE'):
-            self.assertEqual(get_formatted_digits(1234, 123, 0), (5, 0))
-
-        self.assertEqual(get_formatted_digits(dict()), (3, 3))
-        self.assertEqual(get_formatted_digits(dict(number=1)), (1, 3))
-        self.assertEqual(get_formatted_digits(dict(number=12)), (2, 3))
-        self.assertEqual(get_formatted_digits(dict(number=123)), (3, 3))
-        self.assertEqual(get_formatted_digits(dict(number=1234)), (5, 3))
-        with temp_locale('en_US'):
-            self.assertEqual(get_formatted_digits(dict(number=1234)), (5, 3))
-        with temp_locale('de_DE'):
-            self.assertEqual(get_formatted_digits(dict(number=1234)), (5, 3))
-
-        self.assertEqual(get_formatted_digits(dict(delta=1)), (3, 1))
-        self.assertEqual(get_formatted_digits(dict(number=1, delta=1)), (1, 1))
-        self.assertEqual(get_formatted_digits(dict(number=1, delta=12)), (1, 2))
-        self.assertEqual(get_formatted_digits(dict(number=1, delta=123)), (1, 3))
-        self.assertEqual(get_formatted_digits(dict(number=1, delta=1234)), (1, 5))
-        with temp_locale('en_US'):
-            self.assertEqual(get_formatted_digits(dict(number=1, delta=1234)), (1, 5))
-        with temp_locale('de_DE'):
-            self.assertEqual(get_formatted_digits(dict(number=1, delta=1234)), (1, 5))
+        for loc in [None, 'en_US', 'de_DE']:
+            with self.subTest(locale=loc), temp_locale(loc):
+                for args, expected in self.formatted_digits_cases:
+                    with self.subTest(args=args):
+                        self.assertEqual(get_formatted_digits(*args), expected)
 
     def test_get_magnitude(self):
         self.assertEqual(None, get_magnitude(None))
@@ -400,69 +486,19 @@ class PublishTest(unittest.TestCase):
         self.assertEqual(as_short_commit('b469da3d223225fa3f014a3c9e9466b42a1471c5'), 'b469da3d')
 
     def test_as_delta(self):
-        self.assertEqual(as_delta(0, 1), '±0')
-        self.assertEqual(as_delta(+1, 1), '+1')
-        self.assertEqual(as_delta(-2, 1), ' - 2')
-
-        self.assertEqual(as_delta(0, 2), '±  0')
-        self.assertEqual(as_delta(+1, 2), '+  1')
-        self.assertEqual(as_delta(-2, 2), ' -   2')
-
-        self.assertEqual(as_delta(1, 5), '+       1')
-        self.assertEqual(as_delta(12, 5), '+     12')
-        self.assertEqual(as_delta(123, 5), '+   123')
-        self.assertEqual(as_delta(1234, 5), '+1 234')
-        self.assertEqual(as_delta(1234, 6), '+  1 234')
-        self.assertEqual(as_delta(123, 6), '+     123')
-
-        with temp_locale('en_US'):
-            self.assertEqual(as_delta(1234, 5), '+1 234')
-            self.assertEqual(as_delta(1234, 6), '+  1 234')
-            self.assertEqual(as_delta(123, 6), '+     123')
-        with temp_locale('de_DE'):
-            self.assertEqual(as_delta(1234, 5), '+1 234')
-            self.assertEqual(as_delta(1234, 6), '+  1 234')
-            self.assertEqual(as_delta(123, 6), '+     123')
+        for loc in [None, 'en_US', 'de_DE']:
+            with self.subTest(locale=loc), temp_locale(loc):
+                for args, expected in self.delta_cases:
+                    with self.subTest(args=args):
+                        self.assertEqual(as_delta(*args), expected)
 
     def test_as_stat_number(self):
         label = 'unit'
-        self.assertEqual(as_stat_number(None, 1, 0, label), 'N/A unit')
-
-        self.assertEqual(as_stat_number(1, 1, 0, label), '1 unit')
-        self.assertEqual(as_stat_number(123, 6, 0, label), '     123 unit')
-        self.assertEqual(as_stat_number(1234, 6, 0, label), '  1 234 unit')
-        self.assertEqual(as_stat_number(12345, 6, 0, label), '12 345 unit')
-
-        with temp_locale('en_US'):
-            self.assertEqual(as_stat_number(123, 6, 0, label), '     123 unit')
-            self.assertEqual(as_stat_number(1234, 6, 0, label), '  1 234 unit')
-            self.assertEqual(as_stat_number(12345, 6, 0, label), '12 345 unit')
-        with temp_locale('de_DE'):
-            self.assertEqual(as_stat_number(123, 6, 0, label), '     123 unit')
-            self.assertEqual(as_stat_number(1234, 6, 0, label), '  1 234 unit')
-            self.assertEqual(as_stat_number(12345, 6, 0, label), '12 345 unit')
-
-        self.assertEqual(as_stat_number(dict(number=1), 1, 0, label), '1 unit')
-
-        self.assertEqual(as_stat_number(dict(number=1, delta=-1), 1, 1, label), '1 unit  - 1 ')
-        self.assertEqual(as_stat_number(dict(number=2, delta=+0), 1, 1, label), '2 unit ±0 ')
-        self.assertEqual(as_stat_number(dict(number=3, delta=+1), 1, 1, label), '3 unit +1 ')
-        self.assertEqual(as_stat_number(dict(number=3, delta=+1), 1, 2, label), '3 unit +  1 ')
-        self.assertEqual(as_stat_number(dict(number=3, delta=+1), 2, 2, label), '  3 unit +  1 ')
-        self.assertEqual(as_stat_number(dict(number=3, delta=+1234), 1, 6, label), '3 unit +  1 234 ')
-        self.assertEqual(as_stat_number(dict(number=3, delta=+12345), 1, 6, label), '3 unit +12 345 ')
-        with temp_locale('en_US'):
-            self.assertEqual(as_stat_number(dict(number=3, delta=+1234), 1, 6, label), '3 unit +  1 234 ')
-            self.assertEqual(as_stat_number(dict(number=3, delta=+12345), 1, 6, label), '3 unit +12 345 ')
-        with temp_locale('de_DE'):
-            self.assertEqual(as_stat_number(dict(number=3, delta=+1234), 1, 6, label), '3 unit +  1 234 ')
-            self.assertEqual(as_stat_number(dict(number=3, delta=+12345), 1, 6, label), '3 unit +12 345 ')
-
-        self.assertEqual(as_stat_number(dict(delta=-1), 3, 1, label), 'N/A unit  - 1 ')
-
-        self.assertEqual(as_stat_number(dict(number=1, delta=-2, new=3), 1, 1, label), '1 unit  - 2, 3 new ')
-        self.assertEqual(as_stat_number(dict(number=2, delta=+0, new=3, gone=4), 1, 1, label), '2 unit ±0, 3 new, 4 gone ')
-        self.assertEqual(as_stat_number(dict(number=3, delta=+1, gone=4), 1, 1, label), '3 unit +1, 4 gone ')
+        for loc in [None, 'en_US', 'de_DE']:
+            with self.subTest(locale=loc), temp_locale(loc):
+                for args, expected in self.stat_number_cases:
+                    with self.subTest(args=args):
+                        self.assertEqual(as_stat_number(*args, label), expected)
 
     def test_as_stat_duration(self):
         label = 'time'
@@ -485,12 +521,7 @@ class PublishTest(unittest.TestCase):
         self.assertEqual(as_stat_duration(dict(delta=123), label), 'N/A time + 2m 3s')
 
     def test_get_stats_digest_undigest(self):
-        digest = get_digest_from_stats(UnitTestRunResults(
-            files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-            tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-            runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=13,
-            commit='commit'
-        ))
+        digest = get_digest_from_stats(stats_with_runs_and_errors)
         self.assertTrue(isinstance(digest, str))
         self.assertTrue(len(digest) > 100)
         stats = get_stats_from_digest(digest)
@@ -587,12 +618,7 @@ class PublishTest(unittest.TestCase):
                 self.assertEqual(expected, actual)
 
     def test_get_commit_line_md(self):
-        stats = UnitTestRunResults(
-            files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-            tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-            runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=13,
-            commit='commit'
-        )
+        stats = stats_with_runs_and_errors
         self.assertEqual(get_commit_line_md(stats), 'Results for commit commit.')
 
         stats_with_delta = UnitTestRunDeltaResults(
@@ -621,12 +647,7 @@ class PublishTest(unittest.TestCase):
     def test_get_long_summary_md_with_single_runs(cls):
         with mock.patch('publish.get_long_summary_with_runs_md') as w:
             with mock.patch('publish.get_long_summary_without_runs_md') as wo:
-                stats = UnitTestRunResults(
-                    files=1, errors=[], suites=2, duration=3, suite_details=cls.details,
-                    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-                    runs=4, runs_succ=5, runs_skip=6, runs_fail=7, runs_error=8,
-                    commit='commit'
-                )
+                stats = stats_without_runs_with_errors
                 test_changes = mock.Mock()
                 get_long_summary_md(stats, 'url', test_changes, 10)
                 w.assert_not_called()
@@ -636,12 +657,7 @@ class PublishTest(unittest.TestCase):
     def test_get_long_summary_md_with_multiple_runs(cls):
         with mock.patch('publish.get_long_summary_with_runs_md') as w:
             with mock.patch('publish.get_long_summary_without_runs_md') as wo:
-                stats = UnitTestRunResults(
-                    files=1, errors=[], suites=2, duration=3, suite_details=cls.details,
-                    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=0,
-                    runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=0,
-                    commit='commit'
-                )
+                stats = stats_with_runs
                 test_changes = mock.Mock()
                 get_long_summary_md(stats, 'url', test_changes, 10)
                 w.assert_called_once_with(stats, 'url', test_changes, 10)
@@ -652,49 +668,35 @@ class PublishTest(unittest.TestCase):
     ####
 
     def test_get_long_summary_with_runs_md(self):
-        self.assertEqual(get_long_summary_with_runs_md(UnitTestRunResults(
-            files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-            tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=0,
-            runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=0,
-            commit='commit'
-        )), (f'1 files    2 suites   3s {duration_label_md}\n'
-             f'4 {all_tests_label_md}   5 {passed_tests_label_md}   6 {skipped_tests_label_md}   7 {failed_tests_label_md}\n'
-             f'9 runs  10 {passed_tests_label_md} 11 {skipped_tests_label_md} 12 {failed_tests_label_md}\n'
-             f'\n'
-             f'Results for commit commit.\n'))
+        self.assertEqual(get_long_summary_with_runs_md(
+            stats_with_runs
+        ), (f'1 files    2 suites   3s {duration_label_md}\n'
+            f'4 {all_tests_label_md}   5 {passed_tests_label_md}   6 {skipped_tests_label_md}   7 {failed_tests_label_md}\n'
+            f'9 runs  10 {passed_tests_label_md} 11 {skipped_tests_label_md} 12 {failed_tests_label_md}\n'
+            f'\n'
+            f'Results for commit commit.\n'))
 
     def test_get_long_summary_with_runs_md_with_errors(self):
-        self.assertEqual(get_long_summary_with_runs_md(UnitTestRunResults(
-            files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-            tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-            runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=13,
-            commit='commit'
-        )), (f'1 files    2 suites   3s {duration_label_md}\n'
-             f'4 {all_tests_label_md}   5 {passed_tests_label_md}   6 {skipped_tests_label_md}   7 {failed_tests_label_md}   8 {test_errors_label_md}\n'
-             f'9 runs  10 {passed_tests_label_md} 11 {skipped_tests_label_md} 12 {failed_tests_label_md} 13 {test_errors_label_md}\n'
-             f'\n'
-             f'Results for commit commit.\n'))
+        self.assertEqual(get_long_summary_with_runs_md(
+            stats_with_runs_and_errors
+        ), (f'1 files    2 suites   3s {duration_label_md}\n'
+            f'4 {all_tests_label_md}   5 {passed_tests_label_md}   6 {skipped_tests_label_md}   7 {failed_tests_label_md}   8 {test_errors_label_md}\n'
+            f'9 runs  10 {passed_tests_label_md} 11 {skipped_tests_label_md} 12 {failed_tests_label_md} 13 {test_errors_label_md}\n'
+            f'\n'
+            f'Results for commit commit.\n'))
 
     def test_get_long_summary_with_runs_md_with_deltas(self):
-        self.assertEqual(get_long_summary_with_runs_md(UnitTestRunDeltaResults(
-            files=n(1, 2), errors=[], suites=n(2, -3), duration=d(3, 4),
-            tests=n(4, -5), tests_succ=n(5, 6), tests_skip=n(6, -7), tests_fail=n(7, 8), tests_error=n(8, -9),
-            runs=n(9, 10), runs_succ=n(10, -11), runs_skip=n(11, 12), runs_fail=n(12, -13), runs_error=n(13, 14),
-            commit='123456789abcdef0', reference_type='type', reference_commit='0123456789abcdef'
-        )), (f'1 files  +  2    2 suites   - 3   3s {duration_label_md} +4s\n'
-             f'4 {all_tests_label_md}  -   5    5 {passed_tests_label_md} +  6    6 {skipped_tests_label_md}  -   7    7 {failed_tests_label_md} +  8    8 {test_errors_label_md}  -   9 \n'
-             f'9 runs  +10  10 {passed_tests_label_md}  - 11  11 {skipped_tests_label_md} +12  12 {failed_tests_label_md}  - 13  13 {test_errors_label_md} +14 \n'
-             f'\n'
-             f'Results for commit 12345678. ± Comparison against type commit 01234567.\n'))
+        self.assertEqual(get_long_summary_with_runs_md(
+            stats_with_deltas
+        ), (f'1 files  +  2    2 suites   - 3   3s {duration_label_md} +4s\n'
+            f'4 {all_tests_label_md}  -   5    5 {passed_tests_label_md} +  6    6 {skipped_tests_label_md}  -   7    7 {failed_tests_label_md} +  8    8 {test_errors_label_md}  -   9 \n'
+            f'9 runs  +10  10 {passed_tests_label_md}  - 11  11 {skipped_tests_label_md} +12  12 {failed_tests_label_md}  - 13  13 {test_errors_label_md} +14 \n'
+            f'\n'
+            f'Results for commit 12345678. ± Comparison against type commit 01234567.\n'))
 
     def test_get_long_summary_with_runs_md_with_details_url_with_fails(self):
         self.assertEqual(get_long_summary_with_runs_md(
-            UnitTestRunResults(
-                files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-                tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=0,
-                runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=0,
-                commit='commit'
-            ),
+            stats_with_runs,
             'https://details.url/'
         ), (f'1 files    2 suites   3s {duration_label_md}\n'
             f'4 {all_tests_label_md}   5 {passed_tests_label_md}   6 {skipped_tests_label_md}   7 {failed_tests_label_md}\n'
@@ -795,16 +797,13 @@ class PublishTest(unittest.TestCase):
              f'Results for commit commit.\n'))
 
     def test_get_long_summary_without_runs_md_with_errors(self):
-        self.assertEqual(get_long_summary_without_runs_md(UnitTestRunResults(
-            files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-            tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-            runs=4, runs_succ=5, runs_skip=6, runs_fail=7, runs_error=8,
-            commit='commit'
-        )), (f'4 {all_tests_label_md}   5 {passed_tests_label_md}  3s [:stopwatch:](https://github.com/EnricoMi/publish-unit-test-result-action/blob/v1.20/README.md#the-symbols "duration of all tests")\n'
-             f'2 suites  6 {skipped_tests_label_md}\n'
-             f'1 files    7 {failed_tests_label_md}  8 {test_errors_label_md}\n'
-             f'\n'
-             f'Results for commit commit.\n'))
+        self.assertEqual(get_long_summary_without_runs_md(
+            stats_without_runs_with_errors
+        ), (f'4 {all_tests_label_md}   5 {passed_tests_label_md}  3s [:stopwatch:](https://github.com/EnricoMi/publish-unit-test-result-action/blob/v1.20/README.md#the-symbols "duration of all tests")\n'
+            f'2 suites  6 {skipped_tests_label_md}\n'
+            f'1 files    7 {failed_tests_label_md}  8 {test_errors_label_md}\n'
+            f'\n'
+            f'Results for commit commit.\n'))
 
     def test_get_long_summary_without_runs_md_with_delta(self):
         self.assertEqual(get_long_summary_without_runs_md(UnitTestRunDeltaResults(
@@ -965,12 +964,7 @@ class PublishTest(unittest.TestCase):
         # makes gzipped digest deterministic
         with mock.patch('gzip.time.time', return_value=0):
             actual = get_long_summary_with_digest_md(
-                UnitTestRunResults(
-                    files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-                    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-                    runs=4, runs_succ=5, runs_skip=6, runs_fail=7, runs_error=8,
-                    commit='commit'
-                )
+                stats_without_runs_with_errors
             )
 
         self.assertEqual(actual, f'4 {all_tests_label_md}   5 {passed_tests_label_md}  3s {duration_label_md}\n'
@@ -989,12 +983,7 @@ class PublishTest(unittest.TestCase):
         # makes gzipped digest deterministic
         with mock.patch('gzip.time.time', return_value=0):
             actual = get_long_summary_with_digest_md(
-                UnitTestRunResults(
-                    files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-                    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=0,
-                    runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=0,
-                    commit='commit'
-                )
+                stats_with_runs
             )
 
         self.assertEqual(actual, f'1 files    2 suites   3s {duration_label_md}\n'
@@ -1013,12 +1002,7 @@ class PublishTest(unittest.TestCase):
         # makes gzipped digest deterministic
         with mock.patch('gzip.time.time', return_value=0):
             actual = get_long_summary_with_digest_md(
-                UnitTestRunResults(
-                    files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-                    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-                    runs=9, runs_succ=10, runs_skip=11, runs_fail=12, runs_error=13,
-                    commit='commit'
-                )
+                stats_with_runs_and_errors
             )
 
         self.assertEqual(actual, f'1 files    2 suites   3s {duration_label_md}\n'
@@ -1061,17 +1045,7 @@ class PublishTest(unittest.TestCase):
         # makes gzipped digest deterministic
         with mock.patch('gzip.time.time', return_value=0):
             actual = get_long_summary_with_digest_md(
-                UnitTestRunDeltaResults(
-                    files=n(1, 2), errors=[], suites=n(2, -3), duration=d(3, 4),
-                    tests=n(4, -5), tests_succ=n(5, 6), tests_skip=n(6, -7), tests_fail=n(7, 8), tests_error=n(8, -9),
-                    runs=n(9, 10), runs_succ=n(10, -11), runs_skip=n(11, 12), runs_fail=n(12, -13), runs_error=n(13, 14),
-                    commit='123456789abcdef0', reference_type='type', reference_commit='0123456789abcdef'
-                ), UnitTestRunResults(
-                    files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-                    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-                    runs=4, runs_succ=5, runs_skip=6, runs_fail=7, runs_error=8,
-                    commit='commit'
-                )
+                stats_with_deltas, stats_without_runs_with_errors
             )
 
         self.assertEqual(actual, f'1 files  +  2    2 suites   - 3   3s {duration_label_md} +4s\n'
@@ -1095,12 +1069,7 @@ class PublishTest(unittest.TestCase):
                     tests=n(4, -5), tests_succ=n(5, 6), tests_skip=n(6, -7), tests_fail=n(7, 8), tests_error=n(8, -9),
                     runs=n(9, 10), runs_succ=n(10, -11), runs_skip=n(11, 12), runs_fail=n(12, -13), runs_error=n(13, 14),
                     commit='123456789abcdef0', reference_type='type', reference_commit='0123456789abcdef'
-                ), UnitTestRunResults(
-                    files=1, errors=[], suites=2, duration=3, suite_details=self.details,
-                    tests=4, tests_succ=5, tests_skip=6, tests_fail=7, tests_error=8,
-                    runs=4, runs_succ=5, runs_skip=6, runs_fail=7, runs_error=8,
-                    commit='commit'
-                )
+                ), stats_without_runs_with_errors
             )
 
         self.assertEqual(actual, f'1 files  +  2    1 errors    2 suites   - 3   3s {duration_label_md} +4s\n'
@@ -1117,12 +1086,7 @@ class PublishTest(unittest.TestCase):
 
     def test_get_long_summary_with_digest_md_with_delta_results_only(self):
         with self.assertRaises(ValueError) as context:
-            get_long_summary_with_digest_md(UnitTestRunDeltaResults(
-                files=n(1, 2), errors=[], suites=n(2, -3), duration=d(3, 4),
-                tests=n(4, -5), tests_succ=n(5, 6), tests_skip=n(6, -7), tests_fail=n(7, 8), tests_error=n(8, -9),
-                runs=n(9, 10), runs_succ=n(10, -11), runs_skip=n(11, 12), runs_fail=n(12, -13), runs_error=n(13, 14),
-                commit='123456789abcdef0', reference_type='type', reference_commit='0123456789abcdef'
-            ))
+            get_long_summary_with_digest_md(stats_with_deltas)
         self.assertIn('stats must be UnitTestRunResults when no digest_stats is given', context.exception.args)
 
     def test_get_test_changes_md(self):
@@ -2047,22 +2011,7 @@ class PublishTest(unittest.TestCase):
                          chunks)
 
     def test_files(self):
-        parsed = process_junit_xml_elems(
-            parse_junit_xml_files([str(test_files_path / 'pytest' / 'junit.gloo.elastic.spark.tf.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.gloo.elastic.spark.torch.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.gloo.elastic.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.gloo.standalone.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.gloo.static.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.mpi.integration.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.mpi.standalone.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.mpi.static.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.spark.integration.1.xml'),
-                                   str(test_files_path / 'pytest' / 'junit.spark.integration.2.xml')],
-                                  False, False)
-        ).with_commit('example')
-        results = get_test_results(parsed, False)
-        stats = get_stats(results)
-        md = get_long_summary_md(stats)
+        md = get_long_summary_md(self.stats)
         self.assertEqual(md, (f'  10 files    10 suites   39m 1s {duration_label_md}\n'
                               f'217 {all_tests_label_md} 208 {passed_tests_label_md}   9 {skipped_tests_label_md} 0 {failed_tests_label_md}\n'
                               f'373 runs  333 {passed_tests_label_md} 40 {skipped_tests_label_md} 0 {failed_tests_label_md}\n'
@@ -2116,19 +2065,7 @@ class PublishTest(unittest.TestCase):
 
     def test_files_without_annotations(self):
         parsed = process_junit_xml_elems(
-            parse_junit_xml_files(
-                [str(test_files_path / 'pytest' / 'junit.gloo.elastic.spark.tf.xml'),
-                 str(test_files_path / 'pytest' / 'junit.gloo.elastic.spark.torch.xml'),
-                 str(test_files_path / 'pytest' / 'junit.gloo.elastic.xml'),
-                 str(test_files_path / 'pytest' / 'junit.gloo.standalone.xml'),
-                 str(test_files_path / 'pytest' / 'junit.gloo.static.xml'),
-                 str(test_files_path / 'pytest' / 'junit.mpi.integration.xml'),
-                 str(test_files_path / 'pytest' / 'junit.mpi.standalone.xml'),
-                 str(test_files_path / 'pytest' / 'junit.mpi.static.xml'),
-                 str(test_files_path / 'pytest' / 'junit.spark.integration.1.xml'),
-                 str(test_files_path / 'pytest' / 'junit.spark.integration.2.xml')],
-                False, drop_testcases=True
-            )
+            parse_junit_xml_files(pytest_files, False, drop_testcases=True)
         ).with_commit('example')
         results = get_test_results(parsed, False)
         stats = get_stats(results)